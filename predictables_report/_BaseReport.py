@@ -1,17 +1,25 @@
 """
 The BaseReport class contains the basic functionality of a report. It is the base class for all other report classes.
+
+matplotlib, pygments and multiprocessing are slow to import, so they are imported
+inside the methods that use them rather than at the top of this module.
 """
 
+import copy
 import datetime
+import functools
 import itertools
 import os
+import string
+import sys
 import uuid
 import warnings
-from typing import List, Optional, Dict
+from collections import OrderedDict
+from dataclasses import dataclass
+from io import BytesIO
+from typing import BinaryIO, Dict, Iterable, List, Optional, Set, Tuple, Union
 
-import matplotlib.pyplot as plt  # type: ignore
 import pandas as pd  # type: ignore
-import pygments  # type: ignore
 from reportlab.lib.colors import black, lightgrey, white  # type: ignore
 from reportlab.lib.enums import TA_CENTER  # type: ignore
 from reportlab.lib.pagesizes import inch  # type: ignore
@@ -19,18 +27,324 @@ from reportlab.lib.styles import ParagraphStyle  # type: ignore
 from reportlab.platypus import Image  # type: ignore
 from reportlab.platypus import PageBreak  # type: ignore
 from reportlab.platypus import Paragraph  # type: ignore
+from reportlab.platypus import Preformatted  # type: ignore
 from reportlab.platypus import Spacer  # type: ignore
 from reportlab.platypus import Table  # type: ignore
 from reportlab.platypus import TableStyle  # type: ignore
+from reportlab.platypus import XPreformatted  # type: ignore
 from reportlab.platypus.flowables import Flowable  # type: ignore
 from reportlab.lib.styles import getSampleStyleSheet  # type: ignore
+from reportlab.lib.styles import StyleSheet1  # type: ignore
+
+# The sample stylesheet is expensive to build, so it is only built once. Each
+# report starts from its own copy of it (see `_copy_stylesheet`).
+_BASE_STYLES = getSampleStyleSheet()
+
+
+def _copy_stylesheet(stylesheet: StyleSheet1) -> StyleSheet1:
+    """
+    Returns a copy of `stylesheet` with its own copy of every style, so editing a
+    style in the copy does not affect `stylesheet`. Copying the styles is still
+    cheaper than building the sample stylesheet again. Aliases and parents point
+    at the copied styles.
+    """
+    copies = {id(style): copy.copy(style) for style in stylesheet.byName.values()}
+    for style in copies.values():
+        if style.parent is not None:
+            style.parent = copies.get(id(style.parent), style.parent)
+
+    new_stylesheet = StyleSheet1()
+    new_stylesheet.byName = {
+        name: copies[id(style)] for name, style in stylesheet.byName.items()
+    }
+    new_stylesheet.byAlias = {
+        alias: copies[id(style)] for alias, style in stylesheet.byAlias.items()
+    }
+    return new_stylesheet
+
+
+_ROMAN_SYMBOLS = (
+    (1000, "M"),
+    (900, "CM"),
+    (500, "D"),
+    (400, "CD"),
+    (100, "C"),
+    (90, "XC"),
+    (50, "L"),
+    (40, "XL"),
+    (10, "X"),
+    (9, "IX"),
+    (5, "V"),
+    (4, "IV"),
+    (1, "I"),
+)
+
+
+def _decimal_to_roman(number: int, is_upper: bool = True) -> str:
+    """Returns `number` as a roman numeral, eg 14 -> "XIV"."""
+    parts = []
+    for value, symbol in _ROMAN_SYMBOLS:
+        sym = symbol if is_upper else symbol.lower()
+        while number >= value:
+            parts.append(sym)
+            number -= value
+
+    return "".join(parts)
+
+
+def _decimal_to_abc(number: int, is_upper: bool = True) -> str:
+    """Returns `number` in bijective base 26, eg 1 -> "A", 26 -> "Z", 27 -> "AA"."""
+    alphabet = string.ascii_uppercase if is_upper else string.ascii_lowercase
+
+    parts = []
+    while number > 0:
+        number -= 1
+        parts.append(alphabet[number % 26])
+        number //= 26
+
+    return "".join(reversed(parts))
+
+
+# Translation table for `_escape`. str.translate does the replacement in C.
+_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+def _escape(text) -> str:
+    """Escapes the characters ReportLab reads as markup, so `text` is shown as written."""
+    return str(text).translate(_ESCAPE)
+
+
+# Number style name (as accepted by `ol`) -> function formatting a single number
+_NUMBER_STYLES = {
+    "decimal": str,
+    "lower-roman": functools.partial(_decimal_to_roman, is_upper=False),
+    "upper-roman": functools.partial(_decimal_to_roman, is_upper=True),
+    "lower-alpha": functools.partial(_decimal_to_abc, is_upper=False),
+    "upper-alpha": functools.partial(_decimal_to_abc, is_upper=True),
+}
+
+
+def _get_figure(plot):
+    """Returns the matplotlib Figure for a Figure, an Axes, or a (Figure, Axes) tuple."""
+    from matplotlib.figure import Figure  # type: ignore
+
+    if isinstance(plot, tuple):
+        plot = plot[0]
+    return plot if isinstance(plot, Figure) else plot.get_figure()
+
+
+@functools.lru_cache(maxsize=64)
+def _caption_style(
+    normal_attrs: Tuple[Tuple[str, object], ...], page_width: float, width: float
+) -> ParagraphStyle:
+    """
+    Returns the style that centers a caption under an element `width` inches wide
+    on a page `page_width` inches wide. `normal_attrs` are the attributes of the
+    report's Normal style, as from `_style_attrs`, so the cache is keyed by what
+    the Normal style currently looks like rather than by the style object, which
+    can be edited in place.
+    """
+    # Calculate the left and right margins to center the caption under the plot
+    total_margin = page_width - width
+    left_margin = total_margin / 2  # Equal margins on both sides
+
+    attrs = {k: v for k, v in normal_attrs if k not in ("name", "parent")}
+    attrs.update(
+        alignment=TA_CENTER,
+        spaceBefore=0,
+        spaceAfter=0,
+        leftIndent=left_margin * inch,
+        rightIndent=left_margin * inch,
+        fontSize=10,  # Adjust font size as needed
+    )
+    return ParagraphStyle("CaptionStyle", **attrs)
+
+
+def _style_attrs(style: ParagraphStyle) -> Tuple[Tuple[str, object], ...]:
+    """Returns the attributes of `style` as a hashable tuple, to use as a cache key."""
+    return tuple(vars(style).items())
+
+
+# Stylesheet key for each heading level, indexed by level (there is no level 0)
+_HEADING_KEYS = (
+    None,
+    "Heading1",
+    "Heading2",
+    "Heading3",
+    "Heading4",
+    "Heading5",
+    "Heading6",
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _create_table_style(font: str = "Helvetica", fontsize: int = 10) -> TableStyle:
+    """
+    Returns the default table style in the given font. Cached, so every table
+    using the same font shares one TableStyle; ReportLab only reads it. The
+    commands use negative (from the end) coordinates, so one style fits tables of
+    any shape; ReportLab resolves them once per table, not once per row.
+    """
+    style = TableStyle(
+        [
+            # Background color of the first row
+            ("BACKGROUND", (0, 0), (-1, 0), lightgrey),
+            # Text color of the first row
+            ("TEXTCOLOR", (0, 0), (-1, 0), black),
+            # Font style of the first row
+            ("FONTNAME", (0, 0), (-1, 0), f"{font}-Bold"),
+            # Font size of the first row
+            ("FONTSIZE", (0, 0), (-1, 0), fontsize),
+            # Double line under the first row
+            ("LINEBELOW", (0, 0), (-1, 0), 1, black),
+            # Background color of the remaining rows
+            ("BACKGROUND", (0, 1), (-1, -1), white),
+            # Text color of the remaining rows
+            ("TEXTCOLOR", (0, 1), (-1, -1), black),
+            # Font style of the remaining rows
+            ("FONTNAME", (0, 1), (-1, -1), f"{font}"),
+            # Font size of the remaining rows
+            ("FONTSIZE", (0, 1), (-1, -1), fontsize),
+            # Single line under the remaining rows
+            ("LINEBELOW", (0, 1), (-1, -1), 1, black),
+            # Single line above the remaining rows
+            ("LINEABOVE", (0, 1), (-1, -1), 0.5, black),
+            # Single line before the first column
+            ("LINEBEFORE", (0, 0), (0, -1), 1, black),
+            # Background color of the first column
+            ("BACKGROUND", (0, 0), (0, -1), lightgrey),
+            # Text color of the first column
+            ("TEXTCOLOR", (0, 0), (0, -1), black),
+            # Font style of the first column
+            ("FONTNAME", (0, 0), (0, -1), f"{font}-Bold"),
+            # Font size of the first column
+            ("FONTSIZE", (0, 0), (0, -1), fontsize),
+            # Single line after the last column:
+            ("LINEAFTER", (-1, 0), (-1, -1), 1, black),
+            # Single line before the first column:
+            ("LINEBEFORE", (0, 0), (0, -1), 1, black),
+            # Thick black line around the entire table
+            ("BOX", (0, 0), (-1, -1), 2, black),
+        ]
+    )
+    return style
+
+
+_DEFAULT_TABLE_STYLE = _create_table_style()
+
+# Element refs only need to be unique, not random, so instead of calling uuid4 (and
+# reading os.urandom) for every element, a random per-process prefix is combined
+# with a counter.
+_PROCESS_NONCE = uuid.uuid4().int & ((1 << 64) - 1)
+_ref_counter = itertools.count()
+
+
+def _new_ref() -> uuid.UUID:
+    """Returns a new element ref, unique within and across processes."""
+    return uuid.UUID(int=(_PROCESS_NONCE << 64) | next(_ref_counter))
+
+
+@dataclass(frozen=True)
+class _Link:
+    """An element that can be referenced later, and its human-readable name."""
+
+    __slots__ = ("element", "name")
+
+    element: Flowable
+    name: str
+
+
+# Image format accepted by `BaseReport.plot` -> extra keyword arguments for savefig
+_PLOT_SAVE_KWARGS: Dict[str, dict] = {
+    "jpeg": {"pil_kwargs": {"quality": 85, "optimize": True}},
+    "png": {},
+}
+
+
+def _save_figure(fig, fmt: str, dpi: int) -> bytes:
+    """Returns the matplotlib Figure `fig` rendered as a `fmt` ("jpeg" or "png") image."""
+    buf = BytesIO()
+    fig.savefig(
+        buf, format=fmt, dpi=dpi, bbox_inches="tight", **_PLOT_SAVE_KWARGS[fmt]
+    )
+    return buf.getvalue()
+
+
+def _render_plot(func, fmt: str, dpi: int) -> bytes:
+    """Calls `func` and returns the figure it plots rendered as a `fmt` image."""
+    import matplotlib.pyplot as plt  # type: ignore
+
+    # pyplot keeps every figure alive until it is closed, so always close it.
+    fig = _get_figure(func())
+    try:
+        return _save_figure(fig, fmt, dpi)
+    finally:
+        plt.close(fig)
+
+
+def _init_plot_worker() -> None:
+    """Makes a `BaseReport.add_plots_parallel` worker process render with Agg."""
+    import matplotlib  # type: ignore
+
+    matplotlib.use("Agg")
+
+
+# The most plots each report keeps in its `BaseReport.plot(..., cache_key=...)` cache
+_PLOT_CACHE_SIZE = 32
+
+
+@functools.lru_cache(maxsize=32)
+def _get_lexer(language: str):
+    """
+    Returns the Pygments lexer for `language`. Cached, since finding a lexer by
+    name scans every installed lexer.
+    """
+    import pygments.lexers  # type: ignore
+
+    return pygments.lexers.get_lexer_by_name(language, ensurenl=False)
+
+
+def _highlight(text: str, language: str) -> str:
+    """
+    Returns `text` as ReportLab markup, with each token colored (and bolded) as in
+    Pygments' default style. Pygments has no ReportLab formatter, so the tokens
+    are formatted here.
+    """
+    from pygments.styles import get_style_by_name  # type: ignore
+
+    style = get_style_by_name("default")
+    parts = []
+    for token, value in _get_lexer(language).get_tokens(text):
+        value = _escape(value)
+        token_style = style.style_for_token(token)
+        if token_style["bold"]:
+            value = f"<b>{value}</b>"
+        if token_style["color"]:
+            value = f'<font color="#{token_style["color"]}">{value}</font>'
+        parts.append(value)
+    return "".join(parts)
 
 
 class BaseReport:
+    __slots__ = (
+        "elements",
+        "styles",
+        "_refs",
+        "_ref_elements",
+        "_ref_names",
+        "_ref_index",
+        "_name_index",
+        "_h",
+        "_normal",
+        "_code",
+        "_warned_styles",
+        "_figure",
+        "_plot_cache",
+        "doc",
+    )
+
     elements: List[Flowable]
     styles: ParagraphStyle
-    links: Dict[uuid.UUID, Dict[str, str]]
-    names: Dict[str, uuid.UUID]
 
     def __init__(
         self,
@@ -48,19 +362,42 @@ class BaseReport:
         """
 
         self.elements: List[Flowable] = []
-        self.styles = getSampleStyleSheet()
-        self.links: Dict[uuid.UUID, Dict[str, str]] = {}
-        self.names: Dict[str, uuid.UUID] = {}  # name to ref lookup
+        self.styles = _copy_stylesheet(_BASE_STYLES)
+
+        # Referenced elements are stored as parallel lists, one entry per call to
+        # `_add` with a ref. `links` and `names` build dictionaries from these.
+        self._refs: List[uuid.UUID] = []
+        self._ref_elements: List[Flowable] = []
+        self._ref_names: List[str] = []
+        self._ref_index: Dict[uuid.UUID, int] = {}  # ref to latest list position
+        self._name_index: Dict[str, int] = {}  # name to latest list position
+        self._warned_styles: Set[Tuple[str, str]] = set()
+        self._figure = None  # created by `_reused_figure` on first use
+        self._plot_cache: OrderedDict = OrderedDict()  # see `plot`, least recent first
+        self._cache_styles()
+
+    def _cache_styles(self) -> None:
+        """
+        Stores direct references to the styles used when adding elements, so that
+        adding an element does not need to look its style up in the stylesheet.
+        Must be called again whenever a style in `self.styles` is replaced.
+        """
+        self._h = [None] + [self.styles[key] for key in _HEADING_KEYS[1:]]
+        self._normal = self.styles["Normal"]
+        self._code = self.styles["Code"]
 
     def style(self, tag, **kwargs):
         """
         Styles the pdf document by updating the stylesheet with the keyword
         arguments passed in. This is used to change the font family, font
-        size, etc. of the document."""
+        size, etc. of the document. Each invalid attribute is only warned about
+        once per report and tag."""
+        style = self.styles.get(tag)
         for k, v in kwargs.items():
-            if hasattr(self.styles.get(tag), k):
-                setattr(self.styles.get(tag), k, v)
-            else:
+            if hasattr(style, k):
+                setattr(style, k, v)
+            elif (tag, k) not in self._warned_styles:
+                self._warned_styles.add((tag, k))
                 warnings.warn(
                     f"Attribute {k} is not a valid attribute of the stylesheet. Ignoring.",
                     SyntaxWarning,
@@ -97,14 +434,36 @@ class BaseReport:
         """
         self.elements.append(element)
 
-        # Update the links and names dictionaries
+        # Record the element so it can be looked up by ref and name
         if ref is not None:
-            self.links[ref] = {"element": element}
+            index = len(self._refs)
             if name is not None:
-                self.links[ref]["name"] = name
-                self.names[name] = ref
+                name = sys.intern(name)
+                self._name_index[name] = index
             else:
-                self.links[ref]["name"] = str(ref)
+                name = str(ref)
+            self._ref_index[ref] = index
+            self._refs.append(ref)
+            self._ref_elements.append(element)
+            self._ref_names.append(name)
+
+    @property
+    def links(self) -> Dict[uuid.UUID, _Link]:
+        """
+        Returns a dictionary from each element ref to the referenced element and its
+        name. Built on each access, so avoid calling it in a loop.
+        """
+        elements, names = self._ref_elements, self._ref_names
+        return {ref: _Link(elements[i], names[i]) for ref, i in self._ref_index.items()}
+
+    @property
+    def names(self) -> Dict[str, uuid.UUID]:
+        """
+        Returns a dictionary from each element name to its ref. Built on each access,
+        so avoid calling it in a loop.
+        """
+        refs = self._refs
+        return {name: refs[i] for name, i in self._name_index.items()}
 
     def heading(
         self,
@@ -113,6 +472,7 @@ class BaseReport:
         return_self: bool = True,
         name: Optional[str] = None,
         ref: Optional[uuid.UUID] = None,
+        escape: bool = False,
     ) -> Optional["BaseReport"]:
         """
         Adds a heading to the document that says, `text`. The heading is
@@ -134,6 +494,9 @@ class BaseReport:
         ref : Optional[uuid.UUID], optional
             The reference of the element to add to the report, by default None. If no reference
             is provided, a new one will be generated.
+        escape : bool, optional
+            Whether to escape "&", "<" and ">" so that `text` is displayed
+            literally instead of being read as ReportLab markup, by default False.
 
 
         Returns
@@ -142,15 +505,39 @@ class BaseReport:
             The current Report object. This method should be called in a
             chain.
         """
-        if level not in range(1, 7):
+        if not 1 <= level <= 6:
             raise ValueError(f"Level must be between 1 and 6, inclusive. Got {level}.")
 
         if ref is None:
-            ref = uuid.uuid4()
+            ref = _new_ref()
 
-        self._add(Paragraph(text, self.styles[f"Heading{level}"]), name, ref)
+        if escape:
+            text = _escape(text)
+
+        self._add(Paragraph(text, self._h[level]), name, ref)
         return self if return_self else None
 
+    def _heading_fast(
+        self,
+        style: ParagraphStyle,
+        text: str,
+        element_id: Optional[str] = None,
+        name: Optional[str] = None,
+        ref: Optional[uuid.UUID] = None,
+    ) -> "BaseReport":
+        """
+        Adds a heading with an already-resolved style. Used by `h1` through `h6`,
+        which know their level up front and so skip the level check and style
+        lookup in `heading`. Otherwise behaves like `heading`, plus the bookmark.
+        """
+        paragraph = Paragraph(text, style)
+        self._add(paragraph, name, _new_ref() if ref is None else ref)
+
+        # Create bookmark, if necessary
+        if element_id is not None:
+            paragraph.addBookmark(element_id, relative=1, level=0)
+        return self
+
     def h1(
         self,
         text: str,
@@ -205,13 +592,7 @@ class BaseReport:
               # headings and a link at the end pointing to the first
               # heading.
         """
-        # Add element to chain
-        self.heading(1, text, return_self=False, name=name, ref=ref)
-
-        # Create bookmark, if necessary
-        if element_id is not None:
-            self.elements[-1].addBookmark(element_id, relative=1, level=0)
-        return self
+        return self._heading_fast(self._h[1], text, element_id, name, ref)
 
     def h2(self, text: str, element_id: Optional[str] = None) -> "BaseReport":
         """
@@ -248,13 +629,7 @@ class BaseReport:
         ...     .build()
         ... ) # Will create a pdf called test.pdf with six headings.
         """
-        # Add element to chain
-        self.heading(2, text, return_self=False)
-
-        # Create bookmark, if necessary
-        if element_id is not None:
-            self.elements[-1].addBookmark(element_id, relative=1, level=0)
-        return self
+        return self._heading_fast(self._h[2], text, element_id)
 
     def h3(self, text: str, element_id: Optional[str] = None) -> "BaseReport":
         """
@@ -291,13 +666,7 @@ class BaseReport:
         ...     .build()
         ... ) # Will create a pdf called test.pdf with six headings.
         """
-        # Add element to chain
-        self.heading(3, text, return_self=False)
-
-        # Create bookmark, if necessary
-        if element_id is not None:
-            self.elements[-1].addBookmark(element_id, relative=1, level=0)
-        return self
+        return self._heading_fast(self._h[3], text, element_id)
 
     def h4(self, text: str, element_id: Optional[str] = None) -> "BaseReport":
         """
@@ -334,13 +703,7 @@ class BaseReport:
         ...     .build()
         ... ) # Will create a pdf called test.pdf with six headings.
         """
-        # Add element to chain
-        self.heading(4, text, return_self=False)
-
-        # Create bookmark, if necessary
-        if element_id is not None:
-            self.elements[-1].addBookmark(element_id, relative=1, level=0)
-        return self
+        return self._heading_fast(self._h[4], text, element_id)
 
     def h5(self, text: str, element_id: Optional[str] = None) -> "BaseReport":
         """
@@ -377,13 +740,7 @@ class BaseReport:
         ...     .build()
         ... ) # Will create a pdf called test.pdf with six headings.
         """
-        # Add element to chain
-        self.heading(5, text, return_self=False)
-
-        # Create bookmark, if necessary
-        if element_id is not None:
-            self.elements[-1].addBookmark(element_id, relative=1, level=0)
-        return self
+        return self._heading_fast(self._h[5], text, element_id)
 
     def h6(self, text: str, element_id: Optional[str] = None) -> "BaseReport":
         """
@@ -420,15 +777,9 @@ class BaseReport:
         ...     .build()
         ... ) # Will create a pdf called test.pdf with six headings.
         """
-        # Add element to chain
-        self.heading(6, text, return_self=False)
-
-        # Create bookmark, if necessary
-        if element_id is not None:
-            self.elements[-1].addBookmark(element_id, relative=1, level=0)
-        return self
+        return self._heading_fast(self._h[6], text, element_id)
 
-    def p(self, text: str) -> "BaseReport":
+    def p(self, text: str, escape: bool = False) -> "BaseReport":
         """
         Adds a paragraph to the document that says, `text`.
 
@@ -436,6 +787,9 @@ class BaseReport:
         ----------
         text : str
             The text to display in the paragraph.
+        escape : bool, optional
+            Whether to escape "&", "<" and ">" so that `text` is displayed
+            literally instead of being read as ReportLab markup, by default False.
 
         Returns
         -------
@@ -460,11 +814,14 @@ class BaseReport:
         ... ) # Will create a pdf called test.pdf with four paragraphs that are
               # all the same, even though they were created with different methods.
         """
+        if escape:
+            text = _escape(text)
+
         # Add element to chain
-        self.elements.append(Paragraph(text, self.styles["Normal"]))
+        self.elements.append(Paragraph(text, self._normal))
         return self
 
-    def text(self, text: str) -> "BaseReport":
+    def text(self, text: str, escape: bool = False) -> "BaseReport":
         """
         Alias for `p`. Adds a paragraph to the document that says, `text`.
 
@@ -472,6 +829,9 @@ class BaseReport:
         ----------
         text : str
             The text to display in the paragraph.
+        escape : bool, optional
+            Whether to escape "&", "<" and ">" so that `text` is displayed
+            literally instead of being read as ReportLab markup, by default False.
 
         Returns
         -------
@@ -496,9 +856,9 @@ class BaseReport:
         ... ) # Will create a pdf called test.pdf with four paragraphs that are
               # all the same, even though they were created with different methods.
         """
-        return self.p(text)
+        return self.p(text, escape)
 
-    def paragraph(self, text: str) -> "BaseReport":
+    def paragraph(self, text: str, escape: bool = False) -> "BaseReport":
         """
         Alias for `p`. Adds a paragraph to the document that says, `text`.
 
@@ -506,6 +866,9 @@ class BaseReport:
         ----------
         text : str
             The text to display in the paragraph.
+        escape : bool, optional
+            Whether to escape "&", "<" and ">" so that `text` is displayed
+            literally instead of being read as ReportLab markup, by default False.
 
         Returns
         -------
@@ -530,7 +893,72 @@ class BaseReport:
         ... ) # Will create a pdf called test.pdf with four paragraphs that are
               # all the same, even though they were created with different methods.
         """
-        return self.p(text)
+        return self.p(text, escape)
+
+    def p_many(self, texts: Iterable[str], escape: bool = False) -> "BaseReport":
+        """
+        Adds one paragraph to the document for each item in `texts`. Equivalent
+        to calling `p` once per item, but faster for many paragraphs.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            The text of each paragraph, in order.
+        escape : bool, optional
+            Whether to escape "&", "<" and ">" so that each text is displayed
+            literally instead of being read as ReportLab markup, by default False.
+
+        Returns
+        -------
+        Report
+            The current Report object. This method should be called in a chain.
+
+        See Also
+        --------
+        p : Adds a single paragraph to the document.
+        paragraphs_from_series : Adds one paragraph per value of a pandas Series.
+
+        Example
+        -------
+        >>> from predictables.util import Report
+        >>> (
+        ...    Report("test.pdf")
+        ...     .p_many(["First paragraph.", "Second paragraph."])
+        ...     .build()
+        ... ) # Will create a pdf called test.pdf with two paragraphs.
+        """
+        if escape:
+            texts = [_escape(t) for t in texts]
+
+        style = self._normal
+        self.elements.extend([Paragraph(t, style) for t in texts])
+        return self
+
+    def paragraphs_from_series(self, series: pd.Series) -> "BaseReport":
+        """
+        Adds one paragraph to the document for each value in `series`, in order.
+        Values that are not strings are converted with `str`.
+
+        Parameters
+        ----------
+        series : pd.Series
+            The values to display, one per paragraph.
+
+        Returns
+        -------
+        Report
+            The current Report object. This method should be called in a chain.
+
+        See Also
+        --------
+        p_many : Adds one paragraph per item of a list of strings.
+        """
+        if not isinstance(series, pd.Series):
+            raise ValueError(
+                f"`series` must be a pandas Series, but got {type(series)}."
+            )
+
+        return self.p_many(series.astype(str).tolist())
 
     def inner_link(self, text: str, inner_link: str):
         """
@@ -572,7 +1000,9 @@ class BaseReport:
         )
         return self
 
-    def ul(self, text: List[str], bullet_char: str = "\u2022") -> "BaseReport":
+    def ul(
+        self, text: List[str], bullet_char: str = "\u2022", escape: bool = False
+    ) -> "BaseReport":
         """
         Adds an unordered list to the document. For each item in `text`, a
         bullet point is added to the list. If a different bullet point
@@ -586,6 +1016,9 @@ class BaseReport:
         bullet_char : str, optional
             The character to use for the bullet point, by default "\u2022"
             (bullet point in unicode)
+        escape : bool, optional
+            Whether to escape "&", "<" and ">" so that each item is displayed
+            literally instead of being read as ReportLab markup, by default False.
 
         Returns
         -------
@@ -606,13 +1039,15 @@ class BaseReport:
         ...     .build()
         ... ) # Will create a pdf called test.pdf with an unordered list with three items.
         """
-        for t in text:
-            self.elements.append(Paragraph(f"{bullet_char} {t}", self.styles["Normal"]))
-        return self
+        if escape:
+            text = [_escape(t) for t in text]
+
+        prefix = f"{bullet_char} "
+        return self.p_many([f"{prefix}{t}" for t in text])
 
-    def _number_style(self, n: int, style: str):
+    def _number_style(self, n: int, style: str) -> List[str]:
         """
-        Returns an iterator of numbers in the given style.
+        Returns the first `n` numbers in the given style, all generated at once.
 
         Parameters
         ----------
@@ -623,64 +1058,18 @@ class BaseReport:
 
         Returns
         -------
-        Iterator[str]
-            An iterator of numbers in the given style.
+        List[str]
+            A list of the numbers 1 through `n` in the given style.
         """
-
-        def decimal_to_roman(number, is_upper=True):
-            roman_symbols = [
-                (1000, "M"),
-                (900, "CM"),
-                (500, "D"),
-                (400, "CD"),
-                (100, "C"),
-                (90, "XC"),
-                (50, "L"),
-                (40, "XL"),
-                (10, "X"),
-                (9, "IX"),
-                (5, "V"),
-                (4, "IV"),
-                (1, "I"),
-            ]
-
-            result = ""
-            for value, symbol in roman_symbols:
-                while number >= value:
-                    result += symbol if is_upper else symbol.lower()
-                    number -= value
-
-            return result
-
-        def decimal_to_abc(number, is_upper=True):
-            alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-
-            result = ""
-            while number > 0:
-                number -= 1
-                result += (
-                    alphabet[number % 26] if is_upper else alphabet[number % 26].lower()
-                )
-                number //= 26
-
-            return result[::-1]
-
-        decimal_numb = itertools.count(1)
-
-        if style == "decimal":
-            return decimal_numb
-        elif style == "lower-roman":
-            return map(lambda x: decimal_to_roman(x, False), decimal_numb)
-        elif style == "upper-roman":
-            return map(lambda x: decimal_to_roman(x, True), decimal_numb)
-        elif style == "lower-alpha":
-            return map(lambda x: decimal_to_abc(x, False), decimal_numb)
-        elif style == "upper-alpha":
-            return map(lambda x: decimal_to_abc(x, True), decimal_numb)
-        else:
+        to_style = _NUMBER_STYLES.get(style)
+        if to_style is None:
             raise ValueError(f"Style {style} is not a valid number style.")
 
-    def ol(self, text: List[str], number_style: str = "decimal") -> "BaseReport":
+        return [to_style(x) for x in range(1, n + 1)]
+
+    def ol(
+        self, text: List[str], number_style: str = "decimal", escape: bool = False
+    ) -> "BaseReport":
         """
         Adds an ordered list to the document. For each item in `text`, an item
         number is added to the list. If a different number style is desired, it
@@ -694,6 +1083,9 @@ class BaseReport:
         number_style : str, optional
             The style to use for the item numbers, by default "decimal", but also
             accepts "lower-roman", "upper-roman", "lower-alpha", and "upper-alpha".
+        escape : bool, optional
+            Whether to escape "&", "<" and ">" so that each item is displayed
+            literally instead of being read as ReportLab markup, by default False.
 
         Returns
         -------
@@ -714,12 +1106,11 @@ class BaseReport:
         ...     .build()
         ... ) # Will create a pdf called test.pdf with an ordered list with three items.
         """
-        styled_numbers = self._number_style(len(text), number_style)
-        for t in text:
-            self.elements.append(
-                Paragraph(f"{next(styled_numbers)}. {t}", self.styles["Normal"])
-            )
-        return self
+        if escape:
+            text = [_escape(t) for t in text]
+
+        numbers = self._number_style(len(text), number_style)
+        return self.p_many([f"{number}. {t}" for number, t in zip(numbers, text)])
 
     def code(self, text: str, language: Optional[str] = None) -> "BaseReport":
         """
@@ -767,16 +1158,11 @@ class BaseReport:
               # that says print('Hello, world!'), and will be syntax highlighted
               # as python code.
         """
-        if language is None:
-            self.elements.append(Paragraph(text, self.styles["Code"]))
+        if language is None or language == "plaintext":
+            self.elements.append(Paragraph(text, self._code))
         else:
             self.elements.append(
-                Paragraph(
-                    pygments.highlight(
-                        text, pygments.lexers.get_lexer_by_name(language)
-                    ),
-                    self.styles["Code"],
-                )
+                XPreformatted(_highlight(text, language), self._code)
             )
         return self
 
@@ -813,15 +1199,18 @@ class BaseReport:
         self.elements.append(Spacer(1, height * inch))
         return self
 
-    def image(self, filename: str, width: float = 7, height: float = 7):
+    def image(
+        self, filename: Union[str, BinaryIO], width: float = 7, height: float = 7
+    ):
         """
         Adds an image to the document. Used to add a saved image to the
         document. Width and height are in inches.
 
         Parameters
         ----------
-        filename : str
-            The filename of the image to add.
+        filename : Union[str, BinaryIO]
+            The filename of the image to add, or a file-like object containing
+            the image.
         width : float
             The width of the image in inches.
         height : float
@@ -840,20 +1229,54 @@ class BaseReport:
         self.elements.append(Image(filename, width * inch, height * inch))
         return self
 
-    def plot(self, func, width: float = 7, height: float = 7):
+    def plot(
+        self,
+        func,
+        width: float = 7,
+        height: float = 7,
+        *,
+        cache_key: Optional[str] = None,
+        reuse_figure: bool = False,
+        fmt: str = "jpeg",
+        dpi: Optional[int] = None,
+    ):
         """
         Adds a plot to the document. The plot is generated by the provided
-        callable `func`. The plot is saved as a temporary image file and then
+        callable `func`. The plot is rendered to an in-memory image and then
         added to the PDF document.
 
         Parameters
         ----------
         func : callable
-            A function that generates and returns a matplotlib plot.
+            A function that generates and returns a matplotlib plot, as a Figure,
+            an Axes, or a (Figure, Axes) tuple. The figure is closed once it has
+            been rendered.
         width : float, optional
             Width of the plot in inches.
         height : float, optional
             Height of the plot in inches.
+        cache_key : Optional[str], optional
+            Optionally names the plot, by default None. If a plot with the same
+            `cache_key` has already been rendered in the same format and dpi by
+            this report (and, with `reuse_figure`, at the same size), `func` is
+            not called and the earlier image is reused. Only reuse a key for plots
+            that are actually identical. Each report keeps its 32 most recently
+            used plots.
+        reuse_figure : bool, optional
+            Whether to draw on a Figure kept by the report, by default False. If
+            True, `func` is instead called with a single Axes on that Figure,
+            which is cleared and reused by every such plot in the report, and
+            its return value is ignored. This skips creating a new figure and
+            canvas (and pyplot) per plot, so it is faster for many plots.
+        fmt : str, optional
+            The image format to render the plot in, either "jpeg" (the default) or
+            "png". JPEG images (saved at quality 85) are several times smaller, so
+            the pdf is smaller and faster to build, and ReportLab can embed them
+            without re-encoding. Use "png" when the plot must be lossless, eg for
+            fine lines or small text that JPEG artifacts would blur.
+        dpi : Optional[int], optional
+            The resolution to render this plot at, by default None, which uses
+            the report's dpi. Around 150 is usually enough for a printed page.
 
         Returns
         -------
@@ -869,20 +1292,153 @@ class BaseReport:
 
         >>> report = Report("test.pdf")
         >>> report.plot(my_plot, 6, 4, "Example plot").build()
+
+        >>> def my_reused_plot(ax):
+        ...     ax.plot([1, 2, 3], [1, 4, 9])
+
+        >>> report.plot(my_reused_plot, 6, 4, reuse_figure=True).build()
         """
-        temp_filename = f"temp_plot_{uuid.uuid4()}.png"
+        if fmt not in _PLOT_SAVE_KWARGS:
+            raise ValueError(f"fmt must be 'jpeg' or 'png', but got {fmt}.")
+        if dpi is None:
+            dpi = self.dpi
+
+        # Plots drawn on the reused figure are sized by the report, so their size
+        # is part of the key. Other plots are sized by `func`.
+        key = (cache_key, fmt, dpi, (width, height) if reuse_figure else None)
+        img = self._plot_cache.get(key) if cache_key is not None else None
+        if img is not None:
+            self._plot_cache.move_to_end(key)
+
+        if img is None:
+            if reuse_figure:
+                fig = self._reused_figure()
+                fig.clear()
+                fig.set_size_inches(width, height)
+                func(fig.add_subplot())
+                img = _save_figure(fig, fmt, dpi)
+            else:
+                # Generate the plot and render it to an in-memory image
+                img = _render_plot(func, fmt, dpi)
 
-        # Generate the plot and save it as a temporary file
-        ax = func()
-        fig = ax.get_figure()
-        fig.savefig(temp_filename, dpi=self.dpi, bbox_inches="tight")
-        plt.close(fig)
+            if cache_key is not None:
+                self._plot_cache[key] = img
+                if len(self._plot_cache) > _PLOT_CACHE_SIZE:
+                    self._plot_cache.popitem(last=False)
 
-        # Add the plot image to the report
-        self = self.image(temp_filename, width, height)
+        # Add the plot image to the report. Each image gets its own buffer, since
+        # ReportLab reads from the buffer's current position.
+        self = self.image(BytesIO(img), width, height)
 
         return self
 
+    def add_plots_parallel(
+        self,
+        plot_fns: Iterable,
+        width: float = 7,
+        height: float = 7,
+        *,
+        fmt: str = "jpeg",
+        dpi: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Adds several plots to the document, rendering them in parallel in a pool of
+        worker processes. Rendering is usually the slowest part of adding a plot,
+        and each plot is rendered independently, so this is faster than calling
+        `plot` once per plot when there are several plots and several cores.
+
+        Parameters
+        ----------
+        plot_fns : Iterable[callable]
+            The functions that generate the plots, as for `plot`. The plots are
+            added in this order. Each function is sent to a worker process, so it
+            must be picklable (eg defined at the top level of a module, not a
+            lambda or nested function).
+        width : float, optional
+            Width of each plot in inches.
+        height : float, optional
+            Height of each plot in inches.
+        fmt : str, optional
+            The image format to render the plots in, "jpeg" (the default) or "png".
+            See `plot`.
+        dpi : Optional[int], optional
+            The resolution to render the plots at, by default None, which uses the
+            report's dpi.
+        max_workers : Optional[int], optional
+            The number of worker processes, by default None, which uses one per
+            CPU, but no more than there are plots.
+
+        Returns
+        -------
+        Report
+            The current Report object. This method should be called in a chain.
+
+        Example
+        -------
+        >>> def plot_a():
+        ...     fig, ax = plt.subplots()
+        ...     ax.plot([1, 2, 3], [1, 4, 9])
+        ...     return fig
+
+        >>> def plot_b():
+        ...     fig, ax = plt.subplots()
+        ...     ax.plot([1, 2, 3], [9, 4, 1])
+        ...     return fig
+
+        >>> report = Report("test.pdf")
+        >>> report.add_plots_parallel([plot_a, plot_b], 6, 4).build()
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        import multiprocessing
+
+        if fmt not in _PLOT_SAVE_KWARGS:
+            raise ValueError(f"fmt must be 'jpeg' or 'png', but got {fmt}.")
+        if dpi is None:
+            dpi = self.dpi
+
+        plot_fns = list(plot_fns)
+        if not plot_fns:
+            return self
+
+        # Forking this process directly is unsafe if it has threads running (eg in
+        # Jupyter), so on Linux fork from a clean server process instead
+        context = multiprocessing.get_context(
+            "forkserver" if sys.platform.startswith("linux") else "spawn"
+        )
+        with ProcessPoolExecutor(
+            max_workers=max_workers or min(len(plot_fns), os.cpu_count() or 1),
+            mp_context=context,
+            initializer=_init_plot_worker,
+        ) as executor:
+            images = list(
+                executor.map(
+                    _render_plot,
+                    plot_fns,
+                    itertools.repeat(fmt),
+                    itertools.repeat(dpi),
+                )
+            )
+
+        for img in images:
+            self = self.image(BytesIO(img), width, height)
+
+        return self
+
+    def _reused_figure(self):
+        """
+        Returns the Figure that `plot(..., reuse_figure=True)` draws on, creating
+        it on first use. It is attached directly to an Agg canvas rather than
+        created through pyplot, so it is never tracked by pyplot.
+        """
+        if self._figure is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg  # type: ignore
+            from matplotlib.figure import Figure  # type: ignore
+
+            self._figure = Figure()
+            FigureCanvasAgg(self._figure)
+        return self._figure
+
     def page_break(self):
         """Adds a page break to the document. Used for adding a page break to the document."""
         self.elements.append(PageBreak())
@@ -913,21 +1469,8 @@ class BaseReport:
         >>> report.caption("This is a caption.").build()
         """
 
-        # Calculate the left and right margins to center the caption under the plot
-        page_width = self.pagesize[0] / inch  # Convert page width to inches
-        total_margin = page_width - width
-        left_margin = total_margin / 2  # Equal margins on both sides
-
-        # Define a custom style for the caption
-        caption_style = ParagraphStyle(
-            "CaptionStyle",
-            parent=self.styles["Normal"],
-            alignment=TA_CENTER,
-            spaceBefore=0,
-            spaceAfter=0,
-            leftIndent=left_margin * inch,
-            rightIndent=left_margin * inch,
-            fontSize=10,  # Adjust font size as needed
+        caption_style = _caption_style(
+            _style_attrs(self._normal), self._page_width_in, width
         )
 
         # Add the caption to the report
@@ -939,77 +1482,85 @@ class BaseReport:
         self,
         df: pd.DataFrame,
         style: TableStyle = None,
+        chunk_size: int = 500,
+        mode: str = "table",
     ):
+        """
+        Adds a table to the document showing the DataFrame `df`, with its index as
+        the first column and its column names as the first row.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The DataFrame to display.
+        style : TableStyle, optional
+            The style to apply to the table, by default None. If no style is
+            provided, a default style with a grey header row and index column is
+            used.
+        chunk_size : int, optional
+            The maximum number of rows (not counting the header) in a single
+            table, by default 500. Longer DataFrames are split into consecutive
+            tables of at most `chunk_size` rows, each repeating the header row.
+            ReportLab lays out long tables in worse than linear time, so this
+            keeps large tables fast to build.
+        mode : str, optional
+            How to lay the table out, either "table" (the default) or "fast". In
+            "fast" mode the table is added as the plain text of `df.to_string()`
+            in the Code style, so ReportLab does not have to measure every cell.
+            This is much faster for large, mostly numeric tables, but `style`
+            and `chunk_size` are ignored, so there are no borders, shading or
+            per-cell styling.
+
+        Returns
+        -------
+        Report
+            The current Report object. This method should be called in a chain.
+
+        Example
+        -------
+        >>> import pandas as pd
+        >>> df = pd.DataFrame({"a": [1, 2], "b": [3, 4]}, index=["x", "y"])
+        >>> Report("test.pdf").table(df).build()
+        """
         if not isinstance(df, pd.DataFrame):
             raise ValueError(f"`df` must be a pandas DataFrame, but got {type(df)}.")
+        if chunk_size <= 0:
+            raise ValueError(f"`chunk_size` must be greater than 0, but got {chunk_size}.")
+        if mode not in ("table", "fast"):
+            raise ValueError(f"`mode` must be 'table' or 'fast', but got {mode}.")
 
-        def create_table_style(font: str = "Helvetica", fontsize: int = 10):
-            style = TableStyle(
-                [
-                    # Background color of the first row
-                    ("BACKGROUND", (0, 0), (-1, 0), lightgrey),
-                    # Text color of the first row
-                    ("TEXTCOLOR", (0, 0), (-1, 0), black),
-                    # Font style of the first row
-                    ("FONTNAME", (0, 0), (-1, 0), f"{font}-Bold"),
-                    # Font size of the first row
-                    ("FONTSIZE", (0, 0), (-1, 0), fontsize),
-                    # Double line under the first row
-                    ("LINEBELOW", (0, 0), (-1, 0), 1, black),
-                    # Background color of the remaining rows
-                    ("BACKGROUND", (0, 1), (-1, -1), white),
-                    # Text color of the remaining rows
-                    ("TEXTCOLOR", (0, 1), (-1, -1), black),
-                    # Font style of the remaining rows
-                    ("FONTNAME", (0, 1), (-1, -1), f"{font}"),
-                    # Font size of the remaining rows
-                    ("FONTSIZE", (0, 1), (-1, -1), fontsize),
-                    # Single line under the remaining rows
-                    ("LINEBELOW", (0, 1), (-1, -1), 1, black),
-                    # Single line above the remaining rows
-                    ("LINEABOVE", (0, 1), (-1, -1), 0.5, black),
-                    # Single line before the first column
-                    ("LINEBEFORE", (0, 0), (0, -1), 1, black),
-                    # Background color of the first column
-                    ("BACKGROUND", (0, 0), (0, -1), lightgrey),
-                    # Text color of the first column
-                    ("TEXTCOLOR", (0, 0), (0, -1), black),
-                    # Font style of the first column
-                    ("FONTNAME", (0, 0), (0, -1), f"{font}-Bold"),
-                    # Font size of the first column
-                    ("FONTSIZE", (0, 0), (0, -1), fontsize),
-                    # Single line after the last column:
-                    ("LINEAFTER", (-1, 0), (-1, -1), 1, black),
-                    # Single line before the first column:
-                    ("LINEBEFORE", (0, 0), (0, -1), 1, black),
-                    # Thick black line around the entire table
-                    ("BOX", (0, 0), (-1, -1), 2, black),
-                ]
-            )
-            return style
+        if mode == "fast":
+            self.elements.append(Preformatted(df.to_string(), self._code))
+            return self
 
         if style is None:
-            style = create_table_style()
+            style = _DEFAULT_TABLE_STYLE
+
+        # Convert the index and values to python lists once, not once per row
+        index = df.index.tolist()
+        values = df.values.tolist()
+        header = [""]
+        header.extend(df.columns.tolist())
+        data = [header]
+        data.extend([i, *row] for i, row in zip(index, values))
+        if len(data) - 1 <= chunk_size:
+            tables = [Table(data)]
+        else:
+            tables = [
+                Table([header] + data[start : start + chunk_size], repeatRows=1)
+                for start in range(1, len(data), chunk_size)
+            ]
 
-        data = [[""] + df.columns.tolist()] + [
-            [df.index.tolist()[i]] + df.values.tolist()[i]
-            for i, _ in enumerate(df.values.tolist())
-        ]
-        t = Table(data)
-        if style is not None:
-            t.setStyle(style)
-        self.elements.append(t)
+        for t in tables:
+            if style is not None:
+                t.setStyle(style)
+        self.elements.extend(tables)
         return self
 
     def build(self):
         """Builds the pdf document and saves it to the filename specified in the constructor. This is the final command that must be called to generate the pdf document."""
         self.doc.build(self.elements)
 
-        # Remove temporary plot files
-        for file in os.listdir():
-            if file.startswith("temp_plot_"):
-                os.remove(file)
-
     def title(self, text: str):
         """Sets the title metadata attribute of the pdf document. Does not by itself make any visible changes to the document."""
         self.doc.title = text
@@ -3,7 +3,7 @@ This module implements the Grid class, which is a container for the BaseReport c
 and is used to implement a CSS-grid-like layout for the report.
 """
 
-from typing import List, Union
+from typing import List, Optional, Tuple, Union
 from predictables_report._BaseReport import BaseReport
 
 
@@ -14,17 +14,43 @@ class Grid(BaseReport):
     essentially a mini report that contains other report elements. 
     """
 
-    def __init__(self, elements) -> None:
+    def __init__(self, elements: Union[BaseReport, List[BaseReport]]) -> None:
         """
         Initializes the Grid object.
 
         Parameters
         ----------
-        args : Union[Report, List[Report]]
+        elements : Union[BaseReport, List[BaseReport]]
             A BaseReport object or a list of BaseReport objects.
         """
         super().__init__()
-        
+        self._reports: List[BaseReport] = (
+            list(elements) if isinstance(elements, list) else [elements]
+        )
+
+        # The rendered HTML is cached, along with the versions of this grid and of
+        # any grids nested in it when it was rendered. Mutators bump `_version`.
+        self._version = 0
+        self._html_cache: Optional[str] = None
+        self._html_cache_key: Optional[Tuple] = None
+
+    def add(self, *reports: BaseReport) -> "Grid":
+        """
+        Adds one or more BaseReport objects to the end of the Grid object.
+
+        Parameters
+        ----------
+        *reports : BaseReport
+            The BaseReport objects to add.
+
+        Returns
+        -------
+        Grid
+            The current Grid object. This method should be called in a chain.
+        """
+        self._reports.extend(reports)
+        self._version += 1
+        return self
 
     def __repr__(self) -> str:
         """
@@ -35,7 +61,7 @@ class Grid(BaseReport):
         str
             A string representation of the Grid object.
         """
-        return f"Grid({', '.join([repr(BaseReport) for Basereport in self._reports])})"
+        return f"Grid({', '.join(repr(report) for report in self._reports)})"
 
     def __str__(self) -> str:
         """
@@ -46,18 +72,32 @@ class Grid(BaseReport):
         str
             A string representation of the Grid object.
         """
-        return f"Grid({', '.join([str(BaseReport) for Basereport in self._reports])})"
+        return f"Grid({', '.join(str(report) for report in self._reports)})"
+
+    def _html_key(self) -> Tuple:
+        """
+        Returns the versions of this Grid object and of every Grid nested in it. The
+        cached HTML is only reused while this key is unchanged.
+        """
+        return (self._version,) + tuple(
+            report._html_key() for report in self._reports if isinstance(report, Grid)
+        )
 
     def _get_html(self) -> str:
         """
-        Returns the HTML representation of the Grid object.
+        Returns the HTML representation of the Grid object. The HTML is cached, and
+        only rebuilt after this grid or a grid nested in it has been changed.
 
         Returns
         -------
         str
             The HTML representation of the Grid object.
         """
-        return f"<div class='grid'>{self._get_reports_html()}</div>"
+        key = self._html_key()
+        if self._html_cache_key != key:
+            self._html_cache = f"<div class='grid'>{self._get_reports_html()}</div>"
+            self._html_cache_key = key
+        return self._html_cache
 
     def _get_reports_html(self) -> str:
         """
@@ -68,7 +108,7 @@ class Grid(BaseReport):
         str
             The HTML representation of the BaseReport objects contained in the Grid object.
         """
-        return "".join([report._get_html() for Basereport in self._reports])
+        return "".join(report._get_html() for report in self._reports)
 
     def _get_css(self) -> str:
         """
@@ -2,12 +2,15 @@ import copy
 from predictables_report._BaseReport import BaseReport
 import warnings
 from typing import List, Optional
+from reportlab import rl_config  # type: ignore
 from reportlab.lib.pagesizes import letter  # type: ignore
-from reportlab.lib.styles import getSampleStyleSheet  # type: ignore
 from reportlab.lib.units import inch  # type: ignore
 from reportlab.platypus import SimpleDocTemplate, Flowable  # type: ignore
 from reportlab.platypus.tableofcontents import TableOfContents  # type: ignore
 
+# Attributes of a pdf document that `Report.set` accepts
+_DOC_ATTRS = frozenset(dir(SimpleDocTemplate("")))
+
 
 class Report(BaseReport):
     def __init__(
@@ -17,6 +20,7 @@ class Report(BaseReport):
         pagesize=letter,
         dpi: int = 200,
         include_toc: bool = True,
+        debug: bool = False,
     ):
         """
         Creates a Report object that can be used to create a pdf document.
@@ -38,6 +42,13 @@ class Report(BaseReport):
         include_toc : bool, optional
             Whether to include a table of contents in the pdf document.
             Defaults to True if not specified.
+        debug : bool, optional
+            Whether to turn on ReportLab's shape checking, which validates
+            attributes set on ReportLab graphics (drawings and charts, not the
+            paragraphs, tables and images added by this class). This sets
+            process-global ReportLab state, so it affects every report in the
+            process, and a report created with `debug=False` does not turn it
+            back off. Defaults to False if not specified.
 
         Returns
         -------
@@ -48,14 +59,16 @@ class Report(BaseReport):
 
         self.filename = filename
         self.pagesize = pagesize
+        self._page_width_in = pagesize[0] / inch  # used to center captions
         self.dpi = dpi
         self.include_toc = include_toc
+        if debug:
+            rl_config.shapeChecking = 1
 
         if margins is None:
             margins = [0.5, 0.5, 0.5, 0.5]
         self.doc = SimpleDocTemplate(filename, pagesize=pagesize)
         self.elements: List[Flowable] = []
-        self.styles = getSampleStyleSheet()
         self.doc.leftMargin = margins[0] * inch
         self.doc.rightMargin = margins[1] * inch
         self.doc.topMargin = margins[2] * inch
@@ -78,14 +91,21 @@ class Report(BaseReport):
         """Implements the copy method for the BaseReport class."""
         return self.__copy__()
 
-    def __deepcopy__(
-        self,
-    ) -> "Report":
-        """Implements the deepcopy method for the BaseReport class."""
+    def __deepcopy__(self, memo: Optional[dict] = None) -> "Report":
+        """
+        Implements the deepcopy method for the BaseReport class.
+
+        Each flowable is copied on its own, so changing an attribute of an element
+        in the copy does not affect the original. The payloads the flowables hold
+        (table cells, image data, paragraph styles) are shared rather than
+        deep-copied: flowables are treated as immutable once they are added to a
+        report, and ReportLab objects are not designed to be deep-copied.
+
+        """
         new_report = self.__class__(
             filename=f"{self.filename.replace('.pdf', '')}-COPY.pdf"
         )
-        new_report.elements = copy.deepcopy(self.elements)
+        new_report.elements = [copy.copy(element) for element in self.elements]
 
         return new_report
 
@@ -94,16 +114,20 @@ class Report(BaseReport):
         return self.__deepcopy__()
 
     def set(self, **kwargs):
-        """Sets the document properties of the pdf document. Does not by itself make any visible changes to the document."""
+        """Sets the document properties of the pdf document. Does not by itself make any visible changes to the document. Invalid attributes are ignored, with a single warning listing all of them."""
+        invalid = []
         for k, v in kwargs.items():
-            if hasattr(self.doc, k):
+            if k in _DOC_ATTRS:
                 setattr(self.doc, k, v)
             else:
-                warnings.warn(
-                    f"Attribute {k} is not a valid attribute of the document. Ignoring.",
-                    SyntaxWarning,
-                    stacklevel=2,
-                )
+                invalid.append(k)
+
+        if invalid:
+            warnings.warn(
+                f"Attributes {invalid} are not valid attributes of the document. Ignoring.",
+                SyntaxWarning,
+                stacklevel=2,
+            )
 
         return self
 
@@ -1,24 +1,69 @@
-from typing import List, Union
+from typing import Dict, List, Union
 
 import pandas as pd
 import polars as pl
 
-from predictables_report.src._to_pd import to_pd_s  # type: ignore
+from predictables_report.src._to_pd import to_pd_df, to_pd_s  # type: ignore
 
 
 def get_unique(x: Union[pd.Series, pl.Series]) -> List:
     """
-    Returns a sorted list of the unique elements from the series `x`. My testing has
-    shown this is either the most efficient method or within the very topmost efficent.
+    Returns a sorted list of the unique elements from the series `x`. The unique
+    values are found and sorted by polars or pandas rather than in python, so only
+    the (usually much shorter) result is converted to python objects. Pandas values
+    are boxed as pandas scalars (eg `Timestamp`), and missing values sort last.
+    Categorical values are sorted by value, not by the order of the categories.
 
     Parameters
     ----------
-    x : pd.Series
-        A pandas series.
+    x : Union[pd.Series, pl.Series]
+        A pandas or polars series. Anything accepted by `to_pd_s` (eg a list or a
+        1D numpy array) also works.
 
     Returns
     -------
     List
         A sorted list of the unique elements from the series `x`.
     """
-    return list(sorted(set(to_pd_s(x))))
+    if isinstance(x, pl.Series):
+        if isinstance(x.dtype, (pl.Categorical, pl.Enum)):
+            x = x.cast(pl.String)
+        return x.unique(maintain_order=False).sort(nulls_last=True).to_list()
+
+    uniques = pd.Series(pd.unique(to_pd_s(x)))
+    if isinstance(uniques.dtype, pd.CategoricalDtype):
+        uniques = uniques.astype(object)
+    return uniques.sort_values().tolist()
+
+
+def get_unique_many(
+    df: Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame]
+) -> Dict[str, List]:
+    """
+    Returns a sorted list of the unique elements of every column in `df`. For a
+    polars frame, the uniques of all the columns are found in a single query,
+    rather than one `get_unique` call per column. Values are sorted as in
+    `get_unique`.
+
+    Parameters
+    ----------
+    df : Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame]
+        A pandas or polars dataframe. Anything accepted by `to_pd_df` also works.
+
+    Returns
+    -------
+    Dict[str, List]
+        A dictionary mapping each column name to the sorted list of its unique
+        elements, in the same order as the columns of `df`.
+    """
+    if isinstance(df, (pl.DataFrame, pl.LazyFrame)):
+        uniques = (
+            df.lazy()
+            .with_columns(pl.col(pl.Categorical, pl.Enum).cast(pl.String))
+            .select(pl.all().unique().sort(nulls_last=True).implode())
+            .collect()
+        )
+        return uniques.row(0, named=True) if uniques.height else {}
+
+    df = to_pd_df(df)
+    return {c: get_unique(df[c]) for c in df.columns}
@@ -0,0 +1,46 @@
+import pytest
+from reportlab.platypus import Paragraph, XPreformatted  # type: ignore
+from predictables_report._Report import Report
+
+
+@pytest.fixture
+def report():
+    # Setup fixture for Report instance
+    return Report(filename="test_report.pdf")
+
+
+@pytest.mark.parametrize("language", [None, "plaintext"])
+def test_code_plaintext(report, language):
+    report = report.code("print('Hello, world!')", language=language)
+    element = report.elements[-1]
+    assert isinstance(element, Paragraph), f"Expected a Paragraph, got {type(element)}"
+    assert (
+        element.getPlainText() == "print('Hello, world!')"
+    ), f"Expected the code as written, got {element.getPlainText()}"
+
+
+def test_code_highlighted(report):
+    text = "if x < 1:\n    print('a & b')"
+    report = report.code(text, language="py")
+    element = report.elements[-1]
+    assert isinstance(
+        element, XPreformatted
+    ), f"Expected an XPreformatted, got {type(element)}"
+    assert (
+        element.getPlainText() == text
+    ), f"Expected the code as written, got {element.getPlainText()!r}"
+    colors = {frag.textColor.hexval() for frag in element.frags}
+    assert len(colors) > 1, f"Expected the code to be highlighted, got colors {colors}"
+
+
+def test_code_builds(report, tmp_path):
+    report.doc.filename = str(tmp_path / "test_report.pdf")
+    report.code("def f(x):\n    return x + 1", language="py").build()
+    assert (tmp_path / "test_report.pdf").exists(), "Expected the pdf to be built"
+
+
+def test_code_unknown_language(report):
+    from pygments.util import ClassNotFound  # type: ignore
+
+    with pytest.raises(ClassNotFound):
+        report.code("x", language="not-a-language")
@@ -83,3 +83,23 @@ def test_report_deep_copy():
     assert (
         deep_copied_report.elements[0] is not original_report.elements[0]
     ), f"Expected {deep_copied_report.elements[0]} to not be {original_report.elements[0]}"
+
+
+def test_report_deep_copy_shares_payloads():
+    import copy
+
+    import pandas as pd
+
+    original_report = Report(filename="test_report.pdf").table(
+        pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    )
+    deep_copied_report = copy.deepcopy(original_report)
+
+    original_table = original_report.elements[-1]
+    copied_table = deep_copied_report.elements[-1]
+    assert (
+        copied_table is not original_table
+    ), f"Expected {copied_table} to not be {original_table}"
+    assert (
+        copied_table._cellvalues is original_table._cellvalues
+    ), "Expected the table data to be shared rather than deep-copied"
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+from predictables_report.src._get_unique import get_unique, get_unique_many
+
+
+@pytest.mark.parametrize(
+    "x, expected",
+    [
+        (pd.Series([3, 1, 2, 3, 1]), [1, 2, 3]),
+        (pd.Series(["b", "a", "b", "c"]), ["a", "b", "c"]),
+        (pd.Series([2.5, 0.5, 2.5]), [0.5, 2.5]),
+        (pl.Series([3, 1, 2, 3, 1]), [1, 2, 3]),
+        (pl.Series(["b", "a", "b", "c"]), ["a", "b", "c"]),
+        (np.array([3, 1, 2, 3, 1]), [1, 2, 3]),
+        ([3, 1, 2, 3, 1], [1, 2, 3]),
+        (
+            pd.Series(
+                pd.to_datetime(
+                    ["2024-01-02", "2024-01-01 00:00:00.000000001", "2024-01-02"],
+                    format="ISO8601",
+                )
+            ),
+            [
+                pd.Timestamp("2024-01-01 00:00:00.000000001"),
+                pd.Timestamp("2024-01-02"),
+            ],
+        ),
+        (pd.Series([3, None, 1, 3], dtype="Int64"), [1, 3, pd.NA]),
+        (pl.Series([3, None, 1, 3]), [1, 3, None]),
+    ],
+)
+def test_get_unique(x, expected):
+    result = get_unique(x)
+    assert result == expected, f"Expected {expected}, got {result}"
+    assert isinstance(result, list), f"Expected a list, got {type(result)}"
+    assert all(
+        type(r) is type(e) for r, e in zip(result, expected)
+    ), f"Expected python objects, got {[type(r) for r in result]}"
+
+
+def test_get_unique_invalid_type():
+    with pytest.raises(TypeError):
+        get_unique("not a series")
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"a": [3, 1, 2, 3], "b": ["y", "x", "y", "z"]}),
+        pl.DataFrame({"a": [3, 1, 2, 3], "b": ["y", "x", "y", "z"]}),
+        pl.DataFrame({"a": [3, 1, 2, 3], "b": ["y", "x", "y", "z"]}).lazy(),
+    ],
+)
+def test_get_unique_many(df):
+    expected = {"a": [1, 2, 3], "b": ["x", "y", "z"]}
+    result = get_unique_many(df)
+    assert result == expected, f"Expected {expected}, got {result}"
+    assert list(result) == ["a", "b"], f"Expected column order, got {list(result)}"
+
+
+@pytest.mark.parametrize("df", [pd.DataFrame(), pl.DataFrame()])
+def test_get_unique_many_no_columns(df):
+    result = get_unique_many(df)
+    assert result == {}, f"Expected {{}}, got {result}"
+
+
+@pytest.mark.parametrize(
+    "df, expected",
+    [
+        (pd.DataFrame({"a": pd.Series([2, None, 1], dtype="Int64")}), [1, 2, pd.NA]),
+        (pl.DataFrame({"a": [2, None, 1]}), [1, 2, None]),
+    ],
+)
+def test_get_unique_many_missing_values_last(df, expected):
+    result = get_unique_many(df)["a"]
+    assert result == expected, f"Expected {expected}, got {result}"
+
+
+@pytest.mark.parametrize(
+    "x",
+    [
+        pd.Series(pd.Categorical(["b", "c", "a", "b"], categories=["c", "b", "a"])),
+        pl.Series(["b", "c", "a", "b"], dtype=pl.Enum(["c", "b", "a"])),
+        pl.Series(["b", "c", "a", "b"], dtype=pl.Categorical),
+    ],
+)
+def test_get_unique_sorts_categoricals_by_value(x):
+    expected = ["a", "b", "c"]
+    result = get_unique(x)
+    assert result == expected, f"Expected {expected}, got {result}"
+
+    frame = x.to_frame("a")
+    result = get_unique_many(frame)["a"]
+    assert result == expected, f"Expected {expected}, got {result}"
@@ -0,0 +1,36 @@
+from predictables_report._Grid import Grid
+
+
+def test_grid_html_contains_each_nested_grid():
+    grid = Grid([Grid([]), Grid([])])
+    assert (
+        grid._get_html()
+        == "<div class='grid'><div class='grid'></div><div class='grid'></div></div>"
+    ), f"Unexpected html: {grid._get_html()}"
+
+
+def test_grid_repr_and_str_list_each_report():
+    grid = Grid([Grid([]), Grid([Grid([])])])
+    assert repr(grid) == "Grid(Grid(), Grid(Grid()))", f"Unexpected repr: {repr(grid)}"
+    assert str(grid) == "Grid(Grid(), Grid(Grid()))", f"Unexpected str: {str(grid)}"
+
+
+def test_grid_accepts_single_report():
+    grid = Grid(Grid([]))
+    assert repr(grid) == "Grid(Grid())", f"Unexpected repr: {repr(grid)}"
+
+
+def test_grid_html_is_cached_until_changed():
+    inner = Grid([])
+    grid = Grid([inner])
+    html = grid._get_html()
+    assert grid._get_html() is html, "Expected the cached html to be reused"
+
+    inner.add(Grid([]))
+    assert (
+        grid._get_html()
+        == "<div class='grid'><div class='grid'><div class='grid'></div></div></div>"
+    ), "Expected changes to a nested grid to invalidate the cache"
+
+    grid.add(Grid([]))
+    assert grid._get_html().count("<div") == 4, "Expected add to invalidate the cache"
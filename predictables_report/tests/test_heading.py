@@ -45,4 +45,45 @@ def test_heading_valid_attributes(report, heading, style, text, level):
     ), f"Expected {text} for rpt1, got {rpt1.elements[0].text}"
     assert (
         rpt2.elements[0].text == text
-    ), f"Expected {text} for rpt2, got {rpt2.elements[0].text}"
\ No newline at end of file
+    ), f"Expected {text} for rpt2, got {rpt2.elements[0].text}"
+
+
+def test_heading_generates_unique_refs(report):
+    for i in range(10):
+        report.heading(1 + i % 6, f"Heading {i}")
+    assert len(report.links) == 10, f"Expected 10 unique refs, got {len(report.links)}"
+
+
+def test_heading_name_and_ref_lookup(report):
+    report.h1("Named heading", name="intro").heading(2, "Unnamed heading")
+    intro_ref = report.names["intro"]
+    assert (
+        report.links[intro_ref].element is report.elements[0]
+    ), "Expected the named ref to point at the first heading"
+    assert (
+        report.links[intro_ref].name == "intro"
+    ), f"Expected name 'intro', got {report.links[intro_ref].name}"
+
+    unnamed_ref, unnamed_link = list(report.links.items())[1]
+    assert unnamed_link.name == str(
+        unnamed_ref
+    ), f"Expected unnamed elements to be named by their ref, got {unnamed_link.name}"
+
+
+@pytest.mark.parametrize("level", [0, 7, -1])
+def test_heading_invalid_level(report, level):
+    with pytest.raises(ValueError):
+        report.heading(level, "Bad heading")
+
+
+@pytest.mark.parametrize("level", [1, 2, 3, 4, 5, 6])
+def test_h_methods_match_heading(report, level):
+    other_report = Report(filename="other_report.pdf").heading(level, "Heading")
+    report = getattr(report, f"h{level}")("Heading")
+    assert (
+        report.elements[0].style is report.styles[f"Heading{level}"]
+    ), f"Expected h{level} to use the Heading{level} style"
+    assert report.elements[0].text == other_report.elements[0].text
+    assert (
+        len(report.links) == len(other_report.links) == 1
+    ), f"Expected h{level} to register a ref like heading, got {len(report.links)}"
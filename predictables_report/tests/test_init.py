@@ -81,3 +81,33 @@ def test_report_init_custom_pagesize(pagesize, expected):
 def test_report_init_incorrect_margins_length():
     with pytest.raises(IndexError):
         Report(filename="test_report.pdf", margins=[0.5, 0.5])
+
+
+@pytest.mark.parametrize("initial", [0, 1])
+def test_report_init_debug(initial, monkeypatch):
+    from reportlab import rl_config  # type: ignore
+
+    monkeypatch.setattr(rl_config, "shapeChecking", initial)
+    Report(filename="test_report.pdf")
+    assert (
+        rl_config.shapeChecking == initial
+    ), f"Expected debug=False to leave shapeChecking at {initial}"
+
+    Report(filename="test_report.pdf", debug=True)
+    assert (
+        rl_config.shapeChecking == 1
+    ), f"Expected debug=True to turn shapeChecking on, got {rl_config.shapeChecking}"
+
+
+def test_report_copy_keeps_debug(monkeypatch):
+    import copy
+
+    from reportlab import rl_config  # type: ignore
+
+    monkeypatch.setattr(rl_config, "shapeChecking", 0)
+    report = Report(filename="test_report.pdf", debug=True)
+    report.copy()
+    copy.deepcopy(report)
+    assert (
+        rl_config.shapeChecking == 1
+    ), f"Expected copying a debug report to keep shapeChecking on, got {rl_config.shapeChecking}"
@@ -0,0 +1,57 @@
+import pytest
+from predictables_report._Report import Report
+
+
+@pytest.fixture
+def report():
+    # Setup fixture for Report instance
+    return Report(filename="test_report.pdf")
+
+
+def test_ul_adds_one_paragraph_per_item(report):
+    report = report.ul(["Item 1", "Item 2", "Item 3"], bullet_char="-")
+    assert [e.text for e in report.elements] == [
+        "- Item 1",
+        "- Item 2",
+        "- Item 3",
+    ], f"Unexpected list items: {[e.text for e in report.elements]}"
+
+
+@pytest.mark.parametrize(
+    "number_style, expected",
+    [
+        ("decimal", ["1", "2", "3", "4"]),
+        ("lower-roman", ["i", "ii", "iii", "iv"]),
+        ("upper-roman", ["I", "II", "III", "IV"]),
+        ("lower-alpha", ["a", "b", "c", "d"]),
+        ("upper-alpha", ["A", "B", "C", "D"]),
+    ],
+)
+def test_ol_number_styles(report, number_style, expected):
+    report = report.ol(["a", "b", "c", "d"], number_style=number_style)
+    assert [e.text.split(".")[0] for e in report.elements] == expected, (
+        f"Expected {expected} for {number_style}, got "
+        f"{[e.text.split('.')[0] for e in report.elements]}"
+    )
+
+
+@pytest.mark.parametrize(
+    "number_style, position, expected",
+    [
+        ("upper-roman", 1994, "MCMXCIV"),
+        ("lower-roman", 49, "xlix"),
+        ("upper-alpha", 26, "Z"),
+        ("upper-alpha", 27, "AA"),
+        ("lower-alpha", 703, "aaa"),
+    ],
+)
+def test_ol_long_lists(report, number_style, position, expected):
+    report = report.ol(["item"] * position, number_style=number_style)
+    assert (
+        report.elements[-1].text == f"{expected}. item"
+    ), f"Expected '{expected}. item', got {report.elements[-1].text}"
+
+
+def test_ol_invalid_number_style(report):
+    with pytest.raises(ValueError):
+        report.ol(["a"], number_style="not-a-style")
@@ -0,0 +1,122 @@
+import pandas as pd
+import pytest
+from reportlab.lib.units import inch  # type: ignore
+from predictables_report._Report import Report
+
+
+@pytest.fixture
+def report():
+    # Setup fixture for Report instance
+    return Report(filename="test_report.pdf")
+
+
+def test_p_many_matches_p(report):
+    texts = ["First paragraph.", "Second paragraph.", "Third paragraph."]
+    one_at_a_time = Report(filename="other_report.pdf")
+    for t in texts:
+        one_at_a_time.p(t)
+
+    report = report.p_many(texts)
+    assert [e.getPlainText() for e in report.elements] == [
+        e.text for e in one_at_a_time.elements
+    ], "Expected p_many to add the same paragraphs as repeated calls to p"
+    assert all(
+        e.style is report.styles["Normal"] for e in report.elements
+    ), "Expected p_many to use the Normal style"
+
+
+def test_paragraphs_from_series(report):
+    report = report.paragraphs_from_series(pd.Series(["a", 1, 2.5]))
+    assert [e.getPlainText() for e in report.elements] == [
+        "a",
+        "1",
+        "2.5",
+    ], f"Unexpected paragraphs: {[e.getPlainText() for e in report.elements]}"
+
+
+def test_paragraphs_from_series_requires_series(report):
+    with pytest.raises(ValueError):
+        report.paragraphs_from_series(["a", "b"])
+
+
+@pytest.mark.parametrize(
+    "add",
+    [
+        lambda r, t: r.p(t, escape=True),
+        lambda r, t: r.text(t, escape=True),
+        lambda r, t: r.p_many([t], escape=True),
+        lambda r, t: r.heading(1, t, escape=True),
+    ],
+)
+def test_escape_shows_markup_literally(report, add):
+    add(report, "x < y & <b>z</b>")
+    assert (
+        report.elements[0].getPlainText() == "x < y & <b>z</b>"
+    ), f"Expected the text to be shown literally, got {report.elements[0].getPlainText()}"
+
+
+def test_escape_list_items(report):
+    report.ul(["a < b"], bullet_char="-", escape=True).ol(["c & d"], escape=True)
+    assert [e.getPlainText() for e in report.elements] == [
+        "- a < b",
+        "1. c & d",
+    ], f"Unexpected list items: {[e.getPlainText() for e in report.elements]}"
+
+
+def test_markup_is_kept_by_default(report):
+    report.p("<b>bold</b>")
+    assert (
+        report.elements[0].getPlainText() == "bold"
+    ), f"Expected markup to be applied, got {report.elements[0].getPlainText()}"
+
+
+def test_caption_reuses_style(report):
+    report.caption("First caption").caption("Second caption")
+    first, second = report.elements[-2:]
+    assert (
+        first.style is second.style
+    ), "Expected captions of the same width to share a style"
+    assert (
+        first.style.leftIndent == 0.75 * inch
+    ), f"Expected 0.75 inch indent, got {first.style.leftIndent}"
+
+    report.caption("Narrow caption", width=5)
+    narrow = report.elements[-1]
+    assert (
+        narrow.style.leftIndent == 1.75 * inch
+    ), f"Expected 1.75 inch indent, got {narrow.style.leftIndent}"
+
+
+def test_caption_follows_normal_style(report):
+    report.caption("Before")
+    report.style("Normal", textColor="red")
+    report.caption("After")
+    before, after = report.elements[-2:]
+    assert (
+        after.style.textColor == "red"
+    ), f"Expected 'red', got {after.style.textColor}"
+    assert (
+        before.style.textColor != "red"
+    ), "Expected earlier captions to keep their style"
+
+
+def test_caption_uses_page_width():
+    report = Report(filename="test_report.pdf", pagesize=(11 * inch, 8.5 * inch))
+    report.caption("Landscape caption")
+    style = report.elements[-1].style
+    assert (
+        style.leftIndent == 2 * inch
+    ), f"Expected 2 inch indent, got {style.leftIndent}"
+
+
+def test_caption_follows_edited_normal_style(report):
+    report.caption("Before")
+    report.styles["Normal"].textColor = "blue"
+    report.caption("After")
+    before, after = report.elements[-2:]
+    assert (
+        after.style.textColor == "blue"
+    ), f"Expected 'blue', got {after.style.textColor}"
+    assert (
+        before.style is not after.style
+    ), "Expected a new caption style after editing the Normal style"
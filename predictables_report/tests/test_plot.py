@@ -0,0 +1,229 @@
+import os
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import pytest  # noqa: E402
+from reportlab.platypus import Image  # noqa: E402
+from predictables_report._Report import Report  # noqa: E402
+
+
+def make_plot():
+    _, ax = plt.subplots()
+    ax.plot([1, 2, 3], [1, 4, 9])
+    return ax
+
+
+def spy_on_images(report, monkeypatch):
+    """Records the bytes of every image buffer `report.plot` passes to `report.image`."""
+    images = []
+    image = report.image
+
+    def recording_image(buf, *args, **kwargs):
+        images.append(buf.getvalue())
+        return image(buf, *args, **kwargs)
+
+    monkeypatch.setattr(report, "image", recording_image)
+    return images
+
+
+@pytest.fixture
+def report(tmp_path, monkeypatch):
+    # Run in a temporary directory so any stray files are easy to spot
+    monkeypatch.chdir(tmp_path)
+    return Report(filename=str(tmp_path / "test_report.pdf"), dpi=50)
+
+
+def test_plot_adds_image(report):
+    report = report.plot(make_plot, 4, 3)
+    assert len(report.elements) == 1, f"Expected 1 element, got {len(report.elements)}"
+    assert isinstance(
+        report.elements[0], Image
+    ), f"Expected an Image, got {type(report.elements[0])}"
+
+
+def test_plot_does_not_write_temp_files(report, tmp_path):
+    report.plot(make_plot, 4, 3).plot(make_plot, 4, 3)
+    assert os.listdir(tmp_path) == [], f"Expected no files, got {os.listdir(tmp_path)}"
+
+    report.build()
+    assert os.listdir(tmp_path) == [
+        "test_report.pdf"
+    ], f"Expected only the pdf, got {os.listdir(tmp_path)}"
+
+
+def test_plot_cache_key_reuses_rendered_plot(report, monkeypatch):
+    calls = []
+    buffers = []
+    image = report.image
+
+    def recording_image(buf, *args, **kwargs):
+        buffers.append(buf)
+        return image(buf, *args, **kwargs)
+
+    monkeypatch.setattr(report, "image", recording_image)
+
+    def counted_plot():
+        calls.append(1)
+        return make_plot()
+
+    report.plot(counted_plot, 4, 3, cache_key="test_plot_cache_key")
+    report.plot(counted_plot, 4, 3, cache_key="test_plot_cache_key")
+    assert len(calls) == 1, f"Expected the plot to be rendered once, got {len(calls)}"
+    assert buffers[0] is not buffers[1], "Expected each image to get its own buffer"
+    assert (
+        buffers[0].getvalue() == buffers[1].getvalue()
+    ), "Expected both images to use the cached bytes"
+
+    report.plot(counted_plot, 4, 3)
+    assert len(calls) == 2, "Expected plots without a cache_key to always be rendered"
+
+    Report(filename="other_report.pdf", dpi=50).plot(
+        counted_plot, 4, 3, cache_key="test_plot_cache_key"
+    )
+    assert len(calls) == 3, "Expected each report to have its own plot cache"
+
+
+def test_plot_cache_key_includes_reused_figure_size(report):
+    calls = []
+
+    def counted_plot(ax):
+        calls.append(1)
+        ax.plot([1, 2, 3], [1, 4, 9])
+
+    report.plot(counted_plot, 4, 3, cache_key="sized", reuse_figure=True)
+    report.plot(counted_plot, 4, 3, cache_key="sized", reuse_figure=True)
+    report.plot(counted_plot, 6, 4, cache_key="sized", reuse_figure=True)
+    assert len(calls) == 2, f"Expected 2 renders, one per size, got {len(calls)}"
+
+
+def test_plot_cache_is_bounded(report, monkeypatch):
+    from predictables_report import _BaseReport
+
+    monkeypatch.setattr(_BaseReport, "_PLOT_CACHE_SIZE", 2)
+    for key in ["a", "b", "a", "c"]:
+        report.plot(make_plot, 4, 3, cache_key=key)
+    cached = [key[0] for key in report._plot_cache]
+    assert cached == [
+        "a",
+        "c",
+    ], f"Expected the least recently used plot to be dropped, got {cached}"
+
+
+@pytest.mark.parametrize(
+    "returns",
+    ["figure", "axes", "tuple"],
+)
+def test_plot_closes_figure(report, returns):
+    def returning_plot():
+        fig, ax = plt.subplots()
+        ax.plot([1, 2, 3], [1, 4, 9])
+        return {"figure": fig, "axes": ax, "tuple": (fig, ax)}[returns]
+
+    open_figures = len(plt.get_fignums())
+    report.plot(returning_plot, 4, 3).plot(returning_plot, 4, 3)
+    assert (
+        len(plt.get_fignums()) == open_figures
+    ), f"Expected {open_figures} open figures, got {len(plt.get_fignums())}"
+    assert len(report.elements) == 2, f"Expected 2 elements, got {len(report.elements)}"
+
+
+def test_plot_reuse_figure(report):
+    axes = []
+
+    def draw(ax):
+        axes.append(ax)
+        ax.plot([1, 2, 3], [1, 4, 9])
+
+    open_figures = len(plt.get_fignums())
+    report.plot(draw, 4, 3, reuse_figure=True).plot(draw, 3, 2, reuse_figure=True)
+    assert len(report.elements) == 2, f"Expected 2 elements, got {len(report.elements)}"
+    assert (
+        axes[0].get_figure() is axes[1].get_figure()
+    ), "Expected both plots to be drawn on the same figure"
+    assert (
+        len(axes[1].get_figure().axes) == 1
+    ), "Expected the figure to be cleared between plots"
+    assert (
+        len(plt.get_fignums()) == open_figures
+    ), "Expected the reused figure not to be tracked by pyplot"
+
+
+def test_build_leaves_other_files_alone(report, tmp_path):
+    (tmp_path / "temp_plot_mine.png").write_bytes(b"not written by the report")
+    report.plot(make_plot, 4, 3).build()
+    assert sorted(os.listdir(tmp_path)) == [
+        "temp_plot_mine.png",
+        "test_report.pdf",
+    ], f"Expected build not to delete unrelated files, got {os.listdir(tmp_path)}"
+
+
+@pytest.mark.parametrize(
+    "kwargs, magic",
+    [
+        ({}, b"\xff\xd8"),
+        ({"fmt": "jpeg"}, b"\xff\xd8"),
+        ({"fmt": "png"}, b"\x89PNG"),
+    ],
+)
+def test_plot_image_format(report, monkeypatch, kwargs, magic):
+    images = spy_on_images(report, monkeypatch)
+    report.plot(make_plot, 4, 3, **kwargs)
+    assert images[0].startswith(magic), f"Expected image to start with {magic}"
+
+
+def test_plot_dpi_override(report, monkeypatch):
+    images = spy_on_images(report, monkeypatch)
+    report.plot(make_plot, 4, 3, fmt="png").plot(make_plot, 4, 3, fmt="png", dpi=100)
+    low, high = images
+    assert len(high) > len(low), "Expected the higher dpi plot to be a larger image"
+
+
+def test_plot_invalid_format(report):
+    with pytest.raises(ValueError):
+        report.plot(make_plot, 4, 3, fmt="gif")
+
+
+def make_other_plot():
+    fig, ax = plt.subplots()
+    ax.bar([1, 2, 3], [3, 1, 2])
+    return fig
+
+
+def test_add_plots_parallel_matches_plot(report, monkeypatch):
+    images = spy_on_images(report, monkeypatch)
+    report.plot(make_plot, 4, 3).plot(make_other_plot, 4, 3)
+    report.add_plots_parallel([make_plot, make_other_plot], 4, 3, max_workers=2)
+
+    assert len(report.elements) == 4, f"Expected 4 elements, got {len(report.elements)}"
+    assert (
+        images[2:] == images[:2]
+    ), "Expected the plots rendered in parallel to match, in order"
+
+
+def test_add_plots_parallel_empty(report):
+    report = report.add_plots_parallel([])
+    assert report.elements == [], f"Expected no elements, got {report.elements}"
+
+
+def test_add_plots_parallel_invalid_format(report):
+    with pytest.raises(ValueError):
+        report.add_plots_parallel([make_plot], fmt="gif")
+
+
+def test_add_plots_parallel_default_workers(report, monkeypatch):
+    import concurrent.futures
+
+    workers = []
+    executor = concurrent.futures.ProcessPoolExecutor
+
+    def recording_executor(*args, max_workers=None, **kwargs):
+        workers.append(max_workers)
+        return executor(*args, max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", recording_executor)
+    monkeypatch.setattr(os, "cpu_count", lambda: 64)
+    report.add_plots_parallel([make_plot, make_other_plot], 4, 3)
+    assert workers == [2], f"Expected 2 workers for 2 plots, got {workers}"
@@ -69,3 +69,16 @@ def test_set_returns_self(report, attribute, value):
     assert (
         report.set(**{attribute: value}) is report
     ), f"Expected set method to return self when setting {attribute}, but got {report.set(**{attribute: value})}"
+
+
+def test_set_warns_once_for_all_invalid_attributes(report):
+    with pytest.warns(SyntaxWarning) as record:
+        report.set(title="New Title", not_an_attribute=1, also_not_an_attribute=2)
+    assert len(record) == 1, f"Expected 1 warning, got {len(record)}"
+    message = str(record[0].message)
+    assert (
+        "not_an_attribute" in message and "also_not_an_attribute" in message
+    ), f"Expected both invalid attributes in the warning, got {message}"
+    assert (
+        report.doc.title == "New Title"
+    ), f"Expected 'New Title', got {report.doc.title}"
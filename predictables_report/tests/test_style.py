@@ -40,3 +40,51 @@ def test_style_returns_self(report):
     assert (
         returned_report is report
     ), f"Expected style method to return self for chaining, but got {returned_report}"
+
+
+def test_style_does_not_leak_between_reports(report):
+    other_report = Report(filename="other_report.pdf")
+    default_size = other_report.styles.get("h1").fontSize
+
+    report.style("h1", fontSize=default_size + 10)
+
+    assert (
+        report.styles.get("Heading1").fontSize == default_size + 10
+    ), "Expected the alias and the style name to refer to the same updated style"
+    assert (
+        other_report.styles.get("h1").fontSize == default_size
+    ), f"Expected other report to keep fontSize {default_size}, got {other_report.styles.get('h1').fontSize}"
+    assert (
+        Report(filename="new_report.pdf").styles.get("h1").fontSize == default_size
+    ), "Expected new reports to start from the default stylesheet"
+
+
+def test_style_applies_to_headings_added_afterwards(report):
+    report = report.style("h2", fontSize=31).h2("Styled heading")
+    assert (
+        report.elements[0].style.fontSize == 31
+    ), f"Expected heading to use the updated style, got fontSize {report.elements[0].style.fontSize}"
+
+
+def test_style_warns_once_per_attribute(report):
+    with pytest.warns(SyntaxWarning) as record:
+        report.style("BodyText", fakeAttribute=1, fontSize=13)
+        report.style("BodyText", fakeAttribute=2)
+
+    assert len(record.list) == 1, f"Expected 1 warning, got {len(record.list)}"
+    assert (
+        report.styles.get("BodyText").fontSize == 13
+    ), "Expected valid attributes to still be set alongside invalid ones"
+
+
+def test_editing_styles_does_not_leak_between_reports(report):
+    default_size = report.styles["Normal"].fontSize
+    report.styles["Normal"].fontSize = default_size + 10
+
+    other = Report(filename="other_report.pdf")
+    assert (
+        other.styles["Normal"].fontSize == default_size
+    ), f"Expected fontSize {default_size}, got {other.styles['Normal'].fontSize}"
+    assert (
+        report.styles["h1"] is report.styles["Heading1"]
+    ), "Expected aliases to refer to the report's copy of the style"
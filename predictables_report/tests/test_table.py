@@ -0,0 +1,89 @@
+import pandas as pd
+import pytest
+from reportlab.platypus import Preformatted, Table
+from predictables_report._Report import Report
+
+
+@pytest.fixture
+def report():
+    # Setup fixture for Report instance
+    return Report(filename="test_report.pdf")
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}, index=["r1", "r2", "r3"])
+
+
+def test_table_adds_table(report, df):
+    report = report.table(df)
+    assert len(report.elements) == 1, f"Expected 1 element, got {len(report.elements)}"
+    assert isinstance(
+        report.elements[0], Table
+    ), f"Expected a Table, got {type(report.elements[0])}"
+    assert report.elements[0]._cellvalues == [
+        ["", "a", "b"],
+        ["r1", 1, "x"],
+        ["r2", 2, "y"],
+        ["r3", 3, "z"],
+    ], f"Unexpected table data: {report.elements[0]._cellvalues}"
+
+
+def test_table_requires_dataframe(report):
+    with pytest.raises(ValueError):
+        report.table([[1, 2], [3, 4]])
+
+
+def test_table_uses_default_style(report, df):
+    report = report.table(df).table(df)
+    assert (
+        report.elements[0]._cellStyles[1][1].fontsize
+        == report.elements[1]._cellStyles[1][1].fontsize
+        == 10
+    ), "Expected both tables to use the default style"
+
+
+@pytest.mark.parametrize(
+    "n_rows, chunk_size, expected_sizes",
+    [
+        (3, 500, [3]),
+        (10, 10, [10]),
+        (11, 10, [10, 1]),
+        (25, 10, [10, 10, 5]),
+    ],
+)
+def test_table_chunks_long_tables(report, n_rows, chunk_size, expected_sizes):
+    df = pd.DataFrame({"a": range(n_rows)})
+    report = report.table(df, chunk_size=chunk_size)
+    assert [
+        len(t._cellvalues) - 1 for t in report.elements
+    ] == expected_sizes, f"Unexpected chunk sizes: {[len(t._cellvalues) - 1 for t in report.elements]}"
+    assert all(
+        t._cellvalues[0] == ["", "a"] for t in report.elements
+    ), "Expected every chunk to start with the header row"
+    assert [row[1] for t in report.elements for row in t._cellvalues[1:]] == list(
+        range(n_rows)
+    ), "Expected the chunks to contain every row, in order"
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_table_invalid_chunk_size(report, df, chunk_size):
+    with pytest.raises(ValueError):
+        report.table(df, chunk_size=chunk_size)
+
+
+def test_table_fast_mode(report, df):
+    report = report.table(df, mode="fast")
+    assert len(report.elements) == 1, f"Expected 1 element, got {len(report.elements)}"
+    table = report.elements[0]
+    assert isinstance(
+        table, Preformatted
+    ), f"Expected a Preformatted, got {type(table)}"
+    assert (
+        "\n".join(table.lines) == df.to_string()
+    ), f"Expected the text of the DataFrame, got {table.lines}"
+
+
+def test_table_invalid_mode(report, df):
+    with pytest.raises(ValueError):
+        report.table(df, mode="slow")